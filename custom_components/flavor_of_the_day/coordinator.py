@@ -43,6 +43,11 @@ class FlavorUpdateCoordinator(DataUpdateCoordinator[FlavorInfo]):
         self.location_id = location_id
         self.config_entry = config_entry
 
+    async def async_request_uncached_refresh(self) -> None:
+        """Request a refresh that skips the provider's daily flavor cache."""
+        self.provider.clear_cache(self.location_id)
+        await self.async_request_refresh()
+
     async def _async_update_data(self) -> FlavorInfo:
         """Fetch data from API endpoint."""
         try:
@@ -6,10 +6,11 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FlavorInfo:
     """Information about a flavor of the day."""
 
@@ -38,7 +39,7 @@ class FlavorInfo:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LocationInfo:
     """Information about a store location."""
 
@@ -49,7 +50,7 @@ class LocationInfo:
     state: str
     zip_code: str | None = None
     phone: str | None = None
-    hours: dict[str, str] | None = None
+    hours: Mapping[str, str] | None = None
     website_url: str | None = None
     latitude: float | None = None
     longitude: float | None = None
@@ -5,20 +5,58 @@ from __future__ import annotations
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import aiohttp
+from aiohttp import hdrs
 from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
     from datetime import date
 
     from custom_components.flavor_of_the_day.models import FlavorInfo, LocationInfo
 
+HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+
+# Scraped pages are a few hundred KB at most; stop reading anything larger
+MAX_PAGE_BYTES = 1_048_576
+READ_CHUNK_SIZE = 32_768
+
+
+class LocationIndex:
+    """A provider's fixed store list, indexed once for id lookups and search."""
+
+    def __init__(self, *locations: LocationInfo) -> None:
+        """Index the given locations."""
+        self._locations = locations
+        self._by_id = {loc.store_id: loc for loc in locations}
+        # Name, city and address lowercased and newline-separated, so a search
+        # term cannot match across two fields
+        self._search_fields = tuple(
+            (loc, f"{loc.name}\n{loc.city}\n{loc.address}".lower()) for loc in locations
+        )
+
+    def get(self, store_id: str) -> LocationInfo | None:
+        """Return the location with the given store ID, if any."""
+        return self._by_id.get(store_id)
+
+    def search(self, search_term: str) -> list[LocationInfo]:
+        """Return locations whose name, city or address contains the term."""
+        if not search_term:
+            return list(self._locations)
+
+        search_lower = search_term.lower()
+        return [loc for loc, fields in self._search_fields if search_lower in fields]
+
 
 class BaseFlavorProvider(ABC):
     """Base class for flavor providers."""
 
+    # Work in progress shared by all provider instances, keyed by URL
+    _inflight: ClassVar[dict[str, asyncio.Future[Any]]] = {}
+
     def __init__(self, session: aiohttp.ClientSession, config: dict[str, Any]) -> None:
         """Initialize the base flavor provider."""
         self.session = session
@@ -36,6 +74,113 @@ class BaseFlavorProvider(ABC):
             total=config.get("request_timeout", 30)
         )  # seconds
 
+        # Flavors change at most once a day, so results are kept per local date
+        self._today_cache: dict[str, tuple[date, FlavorInfo]] = {}
+        self._upcoming_cache: dict[str, tuple[date, list[tuple[date, FlavorInfo]]]] = {}
+
+        # Last good body per URL with its validators, for conditional requests
+        self._page_cache: dict[str, tuple[str | None, str | None, bytes]] = {}
+
+    def _get_cached_flavor(self, location_id: str, today: date) -> FlavorInfo | None:
+        """Return the flavor already fetched today for a location, if any."""
+        cached = self._today_cache.get(location_id)
+        if cached and cached[0] == today:
+            return cached[1]
+        return None
+
+    def _cache_flavor(self, location_id: str, today: date, flavor: FlavorInfo) -> None:
+        """Remember a successfully fetched flavor until the end of the day."""
+        self._today_cache[location_id] = (today, flavor)
+
+    def _get_cached_upcoming(
+        self, location_id: str, today: date
+    ) -> list[tuple[date, FlavorInfo]] | None:
+        """Return the upcoming flavors already fetched today, if any."""
+        cached = self._upcoming_cache.get(location_id)
+        if cached and cached[0] == today:
+            return cached[1]
+        return None
+
+    def _cache_upcoming(
+        self, location_id: str, today: date, flavors: list[tuple[date, FlavorInfo]]
+    ) -> None:
+        """Remember upcoming flavors until the end of the day."""
+        self._upcoming_cache[location_id] = (today, flavors)
+
+    def clear_cache(self, location_id: str) -> None:
+        """Forget the cached flavors for a location so the next lookup refetches."""
+        self._today_cache.pop(location_id, None)
+        self._upcoming_cache.pop(location_id, None)
+
+    async def _fetch_page(self, url: str) -> tuple[int, bytes]:
+        """Fetch a page, revalidating the last copy with ETag/Last-Modified."""
+        headers: dict[str, str] = {}
+        cached = self._page_cache.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers[hdrs.IF_NONE_MATCH] = etag
+            if last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = last_modified
+
+        async with self.session.get(url, headers=headers) as response:
+            if response.status == HTTP_NOT_MODIFIED and cached:
+                return HTTP_OK, cached[2]
+
+            body = bytearray()
+            truncated = False
+            async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+                body += chunk
+                if len(body) > MAX_PAGE_BYTES:
+                    self.logger.debug(
+                        "Stopped reading %s after %s bytes", url, len(body)
+                    )
+                    truncated = True
+                    break
+
+            page = bytes(body)
+            # A cut-off body must not be reused on a later 304
+            if response.status == HTTP_OK and not truncated:
+                etag = response.headers.get(hdrs.ETAG)
+                last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+                if etag or last_modified:
+                    self._page_cache[url] = (etag, last_modified, page)
+            return response.status, page
+
+    async def _single_flight[T](self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Run fetch once for concurrent callers using the same key."""
+        # Several config entries can poll the same page at once; later callers
+        # wait on the first one's result instead of issuing their own request.
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                # Shielded so a cancelled follower cannot cancel the shared fetch
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise
+                # The leader was cancelled, not us; start over and fetch ourselves
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            if not future.done():
+                future.set_exception(err)
+                # Mark the exception retrieved in case nobody else was waiting
+                future.exception()
+            raise
+        else:
+            if not future.done():
+                future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
     async def _rate_limit(self, key: str = "default") -> None:
         """Rate limit requests to avoid overwhelming the provider."""
         now = dt_util.now().timestamp()
@@ -21,6 +21,12 @@ _LOGGER = logging.getLogger(__name__)
 
 HTTP_OK = 200
 
+# Headers sent with every locator API request
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",  # noqa: E501
+    "Accept": "application/json",
+}
+
 
 class CulversProvider(BaseFlavorProvider):
     """Culver's provider implementation."""
@@ -43,11 +49,6 @@ class CulversProvider(BaseFlavorProvider):
         state: str | None = None,
     ) -> list[LocationInfo]:
         """Search for Culver's locations by city, zip, or address."""
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",  # noqa: E501
-            "Accept": "application/json",
-        }
-
         search_location = f"{search_term}, {state}" if state else search_term
 
         params = {
@@ -65,7 +66,7 @@ class CulversProvider(BaseFlavorProvider):
                 params,
             )
             async with self.session.get(
-                url, headers=headers, params=params, timeout=self._timeout
+                url, headers=REQUEST_HEADERS, params=params, timeout=self._timeout
             ) as response:
                 response.raise_for_status()
                 data = await response.json()
@@ -171,10 +172,6 @@ class CulversProvider(BaseFlavorProvider):
         else:
             search_term = zip_code
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",  # noqa: E501
-            "Accept": "application/json",
-        }
         params = {
             "location": search_term,
             "radius": "40233",
@@ -185,7 +182,7 @@ class CulversProvider(BaseFlavorProvider):
 
         try:
             async with self.session.get(
-                url, headers=headers, params=params, timeout=self._timeout
+                url, headers=REQUEST_HEADERS, params=params, timeout=self._timeout
             ) as response:
                 response.raise_for_status()
                 data = await response.json()
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+import re
 
-from bs4 import BeautifulSoup
+import aiohttp
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 from homeassistant.util import dt as dt_util
 
 from custom_components.flavor_of_the_day.exceptions import (
@@ -12,10 +15,84 @@ from custom_components.flavor_of_the_day.exceptions import (
     LocationNotFoundError,
 )
 from custom_components.flavor_of_the_day.models import FlavorInfo, LocationInfo
-from custom_components.flavor_of_the_day.providers.base import BaseFlavorProvider
+from custom_components.flavor_of_the_day.providers.base import (
+    HTTP_OK,
+    BaseFlavorProvider,
+    LocationIndex,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Restrict parsing to the flavor-of-the-day block and its children
+FLAVOR_STRAINER = SoupStrainer(class_=re.compile("flavor-of-the-day"))
+FLAVOR_SELECTOR = sv.compile("[class*='flavor-of-the-day']")
+
+_KNOWN_LOCATIONS = LocationIndex(
+    LocationInfo(
+        store_id="goodberrys-southern-pines",
+        name="Goodberry's - Southern Pines",
+        address="231 Carolina Green Pkwy",
+        city="Southern Pines",
+        state="NC",
+    ),
+    LocationInfo(
+        store_id="goodberrys-raleigh-spring-forest",
+        name="Goodberry's - Raleigh (Spring Forest)",
+        address="2421 Spring Forest Rd.",
+        city="Raleigh",
+        state="NC",
+    ),
+    LocationInfo(
+        store_id="goodberrys-raleigh-strickland",
+        name="Goodberry's - Raleigh (Strickland Rd)",
+        address="9700 Strickland Rd.",
+        city="Raleigh",
+        state="NC",
+    ),
+    LocationInfo(
+        store_id="goodberrys-raleigh-clark-ave",
+        name="Goodberry's - Raleigh (Clark Ave)",
+        address="2042 Clark Ave.",
+        city="Raleigh",
+        state="NC",
+    ),
+    LocationInfo(
+        store_id="goodberrys-cary-kildaire-farm",
+        name="Goodberry's - Cary (Kildaire Farm Rd)",
+        address="1146 Kildaire Farm Rd.",
+        city="Cary",
+        state="NC",
+    ),
+    LocationInfo(
+        store_id="goodberrys-cary-davis-dr",
+        name="Goodberry's - Cary (Davis Dr)",
+        address="2325 Davis Dr.",
+        city="Cary",
+        state="NC",
+    ),
+    LocationInfo(
+        store_id="goodberrys-garner",
+        name="Goodberry's - Garner",
+        address="1407 Garner Station Blvd.",
+        city="Garner",
+        state="NC",
+    ),
+    LocationInfo(
+        store_id="goodberrys-wake-forest",
+        name="Goodberry's - Wake Forest",
+        address="11736 Retail Dr.",
+        city="Wake Forest",
+        state="NC",
+    ),
+    LocationInfo(
+        store_id="goodberrys-durham",
+        name="Goodberry's - Durham",
+        address="3906 N. Roxboro St.",
+        city="Durham",
+        state="NC",
+    ),
+)
+
 
 class GoodberrysProvider(BaseFlavorProvider):
     """Goodberry's provider implementation."""
@@ -38,123 +115,50 @@ class GoodberrysProvider(BaseFlavorProvider):
         state: str | None = None,  # noqa: ARG002
     ) -> list[LocationInfo]:
         """Return a list of all Goodberry's locations, as they are fixed."""
-        known_locations = [
-            LocationInfo(
-                store_id="goodberrys-southern-pines",
-                name="Goodberry's - Southern Pines",
-                address="231 Carolina Green Pkwy",
-                city="Southern Pines",
-                state="NC",
-            ),
-            LocationInfo(
-                store_id="goodberrys-raleigh-spring-forest",
-                name="Goodberry's - Raleigh (Spring Forest)",
-                address="2421 Spring Forest Rd.",
-                city="Raleigh",
-                state="NC",
-            ),
-            LocationInfo(
-                store_id="goodberrys-raleigh-strickland",
-                name="Goodberry's - Raleigh (Strickland Rd)",
-                address="9700 Strickland Rd.",
-                city="Raleigh",
-                state="NC",
-            ),
-            LocationInfo(
-                store_id="goodberrys-raleigh-clark-ave",
-                name="Goodberry's - Raleigh (Clark Ave)",
-                address="2042 Clark Ave.",
-                city="Raleigh",
-                state="NC",
-            ),
-            LocationInfo(
-                store_id="goodberrys-cary-kildaire-farm",
-                name="Goodberry's - Cary (Kildaire Farm Rd)",
-                address="1146 Kildaire Farm Rd.",
-                city="Cary",
-                state="NC",
-            ),
-            LocationInfo(
-                store_id="goodberrys-cary-davis-dr",
-                name="Goodberry's - Cary (Davis Dr)",
-                address="2325 Davis Dr.",
-                city="Cary",
-                state="NC",
-            ),
-            LocationInfo(
-                store_id="goodberrys-garner",
-                name="Goodberry's - Garner",
-                address="1407 Garner Station Blvd.",
-                city="Garner",
-                state="NC",
-            ),
-            LocationInfo(
-                store_id="goodberrys-wake-forest",
-                name="Goodberry's - Wake Forest",
-                address="11736 Retail Dr.",
-                city="Wake Forest",
-                state="NC",
-            ),
-            LocationInfo(
-                store_id="goodberrys-durham",
-                name="Goodberry's - Durham",
-                address="3906 N. Roxboro St.",
-                city="Durham",
-                state="NC",
-            ),
-        ]
-
-        if not search_term:
-            return known_locations
-
-        search_lower = search_term.lower()
-        return [
-            loc
-            for loc in known_locations
-            if search_lower in loc.name.lower()
-            or search_lower in loc.city.lower()
-            or search_lower in loc.address.lower()
-        ]
+        return _KNOWN_LOCATIONS.search(search_term)
 
     async def get_location_by_id(self, location_id: str) -> LocationInfo:
         """Get specific location details by store ID."""
-        all_locations = await self.search_locations("")
-        for location in all_locations:
-            if location.store_id == location_id:
-                return location
+        location = _KNOWN_LOCATIONS.get(location_id)
+        if location is not None:
+            return location
         msg = f"Location with ID {location_id} not found"
         raise LocationNotFoundError(msg)
 
     async def get_current_flavor(self, location_id: str) -> FlavorInfo:
         """Get today's flavor of the day from Goodberry's."""
+        # The page carries no date, so there is no telling whether a posting
+        # is today's; read it on every poll (a 304 keeps that cheap)
+        now = dt_util.now()
         try:
-            async with self.session.get(self.BASE_URL) as response:
-                if response.status != 200:  # noqa: PLR2004
-                    msg = f"Could not access Goodberry's website for location {location_id}"  # noqa: E501
-                    raise FlavorNotAvailableError(msg)  # noqa: TRY301
-
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Find the flavor of the day
-                # The flavor is in a div with a class that contains "flavor-of-the-day"
-                fotd_element = soup.select_one("[class*='flavor-of-the-day']")
-                if fotd_element:
-                    # The flavor name is usually in a strong or h tag
-                    flavor_name_tag = fotd_element.find(
-                        ["h1", "h2", "h3", "h4", "h5", "h6", "strong"]
-                    )
-                    if flavor_name_tag:
-                        flavor_name = flavor_name_tag.get_text(strip=True)
-                        return FlavorInfo(
-                            name=flavor_name,
-                            available_date=dt_util.now(),
-                        )
-
-                msg = f"Could not extract flavor from Goodberry's page for location {location_id}"  # noqa: E501
-                raise FlavorNotAvailableError(msg)  # noqa: TRY301
-
-        except Exception as e:
-            _LOGGER.exception("Error getting current flavor from Goodberry's")
-            msg = f"Could not retrieve flavor for location {location_id}"
+            status, html = await self._fetch_page(self.BASE_URL)
+        except (aiohttp.ClientError, TimeoutError) as e:
+            _LOGGER.exception("Network error getting flavor for %s", location_id)
+            msg = f"Network error accessing Goodberry's website for location {location_id}"  # noqa: E501
             raise FlavorNotAvailableError(msg) from e
+
+        if status != HTTP_OK:
+            msg = f"Could not access Goodberry's website for location {location_id}"
+            raise FlavorNotAvailableError(msg)
+
+        soup = BeautifulSoup(html, "lxml", parse_only=FLAVOR_STRAINER)
+
+        # Find the flavor of the day
+        # The flavor is in a div with a class that contains "flavor-of-the-day"
+        fotd_element = FLAVOR_SELECTOR.select_one(soup)
+        if fotd_element:
+            # The flavor name is usually in a strong or h tag
+            flavor_name_tag = fotd_element.find(
+                ["h1", "h2", "h3", "h4", "h5", "h6", "strong"]
+            )
+            if flavor_name_tag:
+                flavor_name = flavor_name_tag.get_text(strip=True)
+                return FlavorInfo(
+                    name=flavor_name,
+                    available_date=now,
+                )
+
+        msg = (
+            f"Could not extract flavor from Goodberry's page for location {location_id}"
+        )
+        raise FlavorNotAvailableError(msg)
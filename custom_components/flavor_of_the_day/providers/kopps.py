@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import weakref
 from datetime import timedelta
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
 from homeassistant.util import dt as dt_util
 
 from custom_components.flavor_of_the_day.exceptions import (
@@ -14,19 +18,114 @@ from custom_components.flavor_of_the_day.exceptions import (
     LocationNotFoundError,
 )
 from custom_components.flavor_of_the_day.models import FlavorInfo, LocationInfo
-from custom_components.flavor_of_the_day.providers.base import BaseFlavorProvider
+from custom_components.flavor_of_the_day.providers.base import (
+    HTTP_OK,
+    BaseFlavorProvider,
+    LocationIndex,
+)
 
 if TYPE_CHECKING:
     from datetime import date
 
+    from bs4 import Tag
+
 _LOGGER = logging.getLogger(__name__)
 
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_SERVER_ERROR = 500
+
+# Limit on simultaneous requests to kopps.com across all configured stores
+MAX_CONCURRENT_REQUESTS = 4
+
+_KNOWN_LOCATIONS = LocationIndex(
+    LocationInfo(
+        store_id="kopps-greenfield",
+        name="Kopp's Frozen Custard - Greenfield",
+        address="7631 W. Layton Ave.",
+        city="Greenfield",
+        state="WI",
+        zip_code="53220",
+    ),
+    LocationInfo(
+        store_id="kopps-brookfield",
+        name="Kopp's Frozen Custard - Brookfield",
+        address="18880 W. Bluemound Rd.",
+        city="Brookfield",
+        state="WI",
+        zip_code="53045",
+    ),
+    LocationInfo(
+        store_id="kopps-glendale",
+        name="Kopp's Frozen Custard - Glendale",
+        address="5373 N. Port Washington Rd.",
+        city="Glendale",
+        state="WI",
+        zip_code="53217",
+    ),
+)
+
+# Store details returned by get_location_by_id; every store keeps the same hours,
+# shared read-only so no caller can change them for the other stores
+_STORE_HOURS = MappingProxyType(
+    {
+        "monday": "10:30am-10pm",
+        "tuesday": "10:30am-10pm",
+        "wednesday": "10:30am-10pm",
+        "thursday": "10:30am-10pm",
+        "friday": "10:30am-11pm",
+        "saturday": "10:30am-11pm",
+        "sunday": "10:30am-10pm",
+    }
+)
+_LOCATIONS_BY_ID = {
+    "kopps-greenfield": LocationInfo(
+        store_id="kopps-greenfield",
+        name="Kopp's Frozen Custard - Greenfield",
+        address="4200 W. Greenfield Ave.",
+        city="Greenfield",
+        state="WI",
+        phone="(414) 281-2700",
+        hours=_STORE_HOURS,
+    ),
+    "kopps-brookfield": LocationInfo(
+        store_id="kopps-brookfield",
+        name="Kopp's Frozen Custard - Brookfield",
+        address="18800 W. Bluemound Rd.",
+        city="Brookfield",
+        state="WI",
+        phone="(262) 792-2800",
+        hours=_STORE_HOURS,
+    ),
+    "kopps-glendale": LocationInfo(
+        store_id="kopps-glendale",
+        name="Kopp's Frozen Custard - Glendale",
+        address="6263 N. Downer Ave.",
+        city="Glendale",
+        state="WI",
+        phone="(414) 354-9800",
+        hours=_STORE_HOURS,
+    ),
+}
+
+HEADER_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+
+def _is_tomorrow_header(tag: Tag) -> bool:
+    """Return True for the heading that introduces tomorrow's flavors."""
+    return tag.name in HEADER_TAGS and "TOMORROW" in tag.get_text(strip=True).upper()
+
 
 class KoppsProvider(BaseFlavorProvider):
     """Kopp's provider implementation."""
 
     BASE_URL = "https://www.kopps.com"
 
+    # Shared by every instance on a loop; a semaphore binds to the first loop that
+    # waits on it, so each running loop gets its own
+    _request_sems: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, asyncio.Semaphore
+    ] = weakref.WeakKeyDictionary()
+
     @property
     def provider_name(self) -> str:
         """Return the provider name."""
@@ -43,200 +142,152 @@ class KoppsProvider(BaseFlavorProvider):
         state: str | None = None,  # noqa: ARG002
     ) -> list[LocationInfo]:
         """Return a list of all Kopp's locations, as they are fixed."""
-        known_locations = [
-            LocationInfo(
-                store_id="kopps-greenfield",
-                name="Kopp's Frozen Custard - Greenfield",
-                address="7631 W. Layton Ave.",
-                city="Greenfield",
-                state="WI",
-                zip_code="53220",
-            ),
-            LocationInfo(
-                store_id="kopps-brookfield",
-                name="Kopp's Frozen Custard - Brookfield",
-                address="18880 W. Bluemound Rd.",
-                city="Brookfield",
-                state="WI",
-                zip_code="53045",
-            ),
-            LocationInfo(
-                store_id="kopps-glendale",
-                name="Kopp's Frozen Custard - Glendale",
-                address="5373 N. Port Washington Rd.",
-                city="Glendale",
-                state="WI",
-                zip_code="53217",
-            ),
-        ]
-
-        if not search_term:
-            return known_locations
-
-        search_lower = search_term.lower()
-        return [
-            loc
-            for loc in known_locations
-            if search_lower in loc.name.lower()
-            or search_lower in loc.city.lower()
-            or search_lower in loc.address.lower()
-        ]
+        return _KNOWN_LOCATIONS.search(search_term)
 
     async def get_location_by_id(self, location_id: str) -> LocationInfo:
         """Get specific location details by store ID."""
-        # Define known Kopp's locations
-        known_locations = {
-            "kopps-greenfield": LocationInfo(
-                store_id="kopps-greenfield",
-                name="Kopp's Frozen Custard - Greenfield",
-                address="4200 W. Greenfield Ave.",
-                city="Greenfield",
-                state="WI",
-                phone="(414) 281-2700",
-                hours={
-                    "monday": "10:30am-10pm",
-                    "tuesday": "10:30am-10pm",
-                    "wednesday": "10:30am-10pm",
-                    "thursday": "10:30am-10pm",
-                    "friday": "10:30am-11pm",
-                    "saturday": "10:30am-11pm",
-                    "sunday": "10:30am-10pm",
-                },
-            ),
-            "kopps-brookfield": LocationInfo(
-                store_id="kopps-brookfield",
-                name="Kopp's Frozen Custard - Brookfield",
-                address="18800 W. Bluemound Rd.",
-                city="Brookfield",
-                state="WI",
-                phone="(262) 792-2800",
-                hours={
-                    "monday": "10:30am-10pm",
-                    "tuesday": "10:30am-10pm",
-                    "wednesday": "10:30am-10pm",
-                    "thursday": "10:30am-10pm",
-                    "friday": "10:30am-11pm",
-                    "saturday": "10:30am-11pm",
-                    "sunday": "10:30am-10pm",
-                },
-            ),
-            "kopps-glendale": LocationInfo(
-                store_id="kopps-glendale",
-                name="Kopp's Frozen Custard - Glendale",
-                address="6263 N. Downer Ave.",
-                city="Glendale",
-                state="WI",
-                phone="(414) 354-9800",
-                hours={
-                    "monday": "10:30am-10pm",
-                    "tuesday": "10:30am-10pm",
-                    "wednesday": "10:30am-10pm",
-                    "thursday": "10:30am-10pm",
-                    "friday": "10:30am-11pm",
-                    "saturday": "10:30am-11pm",
-                    "sunday": "10:30am-10pm",
-                },
-            ),
-        }
-
-        if location_id in known_locations:
-            return known_locations[location_id]
+        location = _LOCATIONS_BY_ID.get(location_id)
+        if location is not None:
+            return location
         msg = f"Location with ID {location_id} not found"
         raise LocationNotFoundError(msg)
 
+    @classmethod
+    def _get_request_semaphore(cls) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent requests to kopps.com."""
+        loop = asyncio.get_running_loop()
+        sem = cls._request_sems.get(loop)
+        if sem is None:
+            sem = cls._request_sems[loop] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        return sem
+
+    async def _fetch_flavor_preview(self) -> tuple[int, bytes]:
+        """Fetch the flavor preview page, backing off on 429 and 5xx responses."""
+        url = f"{self.BASE_URL}/flavor-preview"
+        status = 0
+        for attempt in range(self._max_retries + 1):
+            async with self._get_request_semaphore():
+                status, body = await self._fetch_page(url)
+            if status != HTTP_TOO_MANY_REQUESTS and status < HTTP_SERVER_ERROR:
+                return status, body
+
+            if attempt < self._max_retries:
+                _LOGGER.debug(
+                    "Kopp's returned HTTP %s (attempt %s/%s), retrying in %ss",
+                    status,
+                    attempt + 1,
+                    self._max_retries + 1,
+                    self._retry_delay * (attempt + 1),
+                )
+                await asyncio.sleep(self._retry_delay * (attempt + 1))
+
+        return status, b""
+
     async def get_current_flavor(self, location_id: str) -> FlavorInfo:
         """Get today's flavor of the day from Kopp's."""
-        try:
-            async with self.session.get(f"{self.BASE_URL}/flavor-preview") as response:
-                if response.status != 200:  # noqa: PLR2004
-                    msg = f"Could not access Kopp's flavor preview page for location {location_id}"  # noqa: E501
-                    raise FlavorNotAvailableError(msg)  # noqa: TRY301
+        # Read the clock once; the cache, day number and available_date share it
+        now = dt_util.now()
+        cached = self._get_cached_flavor(location_id, now.date())
+        if cached is not None:
+            return cached
 
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
+        try:
+            # All Kopp's stores share one preview page, so share the request
+            status, html = await self._single_flight(
+                f"{self.BASE_URL}/flavor-preview", self._fetch_flavor_preview
+            )
+        except (aiohttp.ClientError, TimeoutError) as e:
+            _LOGGER.exception("Network error getting flavor for %s", location_id)
+            msg = f"Network error accessing Kopp's website for location {location_id}"
+            raise FlavorNotAvailableError(msg) from e
 
-                # Get today's day number
-                today = dt_util.now().day
+        if status != HTTP_OK:
+            msg = f"Could not access Kopp's flavor preview page for location {location_id}"  # noqa: E501
+            raise FlavorNotAvailableError(msg)
 
-                # Find the div for today's flavors
-                today_div = soup.find("div", id=str(today))
+        # Only today's div is needed, so skip building the rest of the page
+        soup = BeautifulSoup(
+            html, "lxml", parse_only=SoupStrainer("div", id=str(now.day))
+        )
 
-                if not today_div:
-                    msg = f"Could not find today's flavor div on Kopp's flavor preview page for location {location_id}"  # noqa: E501
-                    raise FlavorNotAvailableError(msg)  # noqa: TRY301
+        # Find the div for today's flavors
+        today_div = soup.find("div", id=str(now.day))
 
-                # Find all flavor names within the div
-                flavors = [
-                    h3.get_text(strip=True)
-                    for h3 in today_div.find_all(
-                        "h3", class_="h5 fw-black text-uppercase mb-0"
-                    )
-                ]
+        if not today_div:
+            msg = f"Could not find today's flavor div on Kopp's flavor preview page for location {location_id}"  # noqa: E501
+            raise FlavorNotAvailableError(msg)
 
-                if not flavors:
-                    msg = f"Could not extract flavors from Kopp's flavor preview page for location {location_id}"  # noqa: E501
-                    raise FlavorNotAvailableError(msg)  # noqa: TRY301
+        # Find all flavor names within the div
+        flavors = [
+            h3.get_text(strip=True)
+            for h3 in today_div.find_all("h3", class_="h5 fw-black text-uppercase mb-0")
+        ]
 
-                return FlavorInfo(
-                    name=" & ".join(flavors),
-                    available_date=dt_util.now(),
-                )
+        if not flavors:
+            msg = f"Could not extract flavors from Kopp's flavor preview page for location {location_id}"  # noqa: E501
+            raise FlavorNotAvailableError(msg)
 
-        except Exception as e:
-            _LOGGER.exception("Error getting current flavor from Kopp's")
-            msg = f"Could not retrieve flavor for location {location_id}"
-            raise FlavorNotAvailableError(msg) from e
+        flavor = FlavorInfo(
+            name=" & ".join(flavors),
+            available_date=now,
+        )
+        self._cache_flavor(location_id, now.date(), flavor)
+        return flavor
 
     async def get_upcoming_flavors(
         self,
-        location_id: str,  # noqa: ARG002, days:  # noqa: ARG002 int = 7
+        location_id: str,
+        days: int = 7,  # noqa: ARG002
     ) -> list[tuple[date, FlavorInfo]]:
         """Get upcoming flavors from Kopp's flavor preview."""
+        today = dt_util.now().date()
+        cached = self._get_cached_upcoming(location_id, today)
+        if cached is not None:
+            return cached
+
         try:
-            async with self.session.get(f"{self.BASE_URL}/flavor-preview") as response:
-                if response.status != 200:  # noqa: PLR2004
-                    _LOGGER.debug("Flavor preview page not accessible")
-                    return []
-
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                upcoming_flavors = []
-
-                # Find the "TOMORROW" section
-                tomorrow_flavors_section = None
-                for header in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
-                    if "TOMORROW" in header.get_text(strip=True).upper():
-                        tomorrow_flavors_section = header
-                        break
-
-                if not tomorrow_flavors_section:
-                    return []
-
-                # Find the flavors within the section
-                flavors = []
-                for sibling in tomorrow_flavors_section.find_next_siblings("p"):
-                    flavor_name_tag = sibling.find("strong")
-                    if flavor_name_tag:
-                        flavors.append(flavor_name_tag.get_text(strip=True))
-                    else:
-                        break
-
-                if flavors:
-                    tomorrow = dt_util.now().date() + timedelta(days=1)
-                    upcoming_flavors.append(
-                        (
-                            tomorrow,
-                            FlavorInfo(
-                                name=" & ".join(flavors),
-                                available_date=dt_util.as_utc(
-                                    dt_util.parse_datetime(f"{tomorrow} 00:00:00")
-                                ),
+            status, html = await self._fetch_flavor_preview()
+            if status != HTTP_OK:
+                _LOGGER.debug("Flavor preview page not accessible")
+                return []
+
+            soup = BeautifulSoup(html, "lxml")
+
+            upcoming_flavors = []
+
+            # Find the "TOMORROW" section; find() stops walking at the first hit
+            tomorrow_flavors_section = soup.find(_is_tomorrow_header)
+
+            if not tomorrow_flavors_section:
+                return []
+
+            # Find the flavors within the section
+            flavors = []
+            for sibling in tomorrow_flavors_section.find_next_siblings("p"):
+                flavor_name_tag = sibling.find("strong")
+                if flavor_name_tag:
+                    flavors.append(flavor_name_tag.get_text(strip=True))
+                else:
+                    break
+
+            if flavors:
+                tomorrow = today + timedelta(days=1)
+                upcoming_flavors.append(
+                    (
+                        tomorrow,
+                        FlavorInfo(
+                            name=" & ".join(flavors),
+                            available_date=dt_util.as_utc(
+                                dt_util.start_of_local_day(tomorrow)
                             ),
-                        )
+                        ),
                     )
+                )
 
-                return upcoming_flavors
         except Exception as e:  # noqa: BLE001
             _LOGGER.debug("Error getting upcoming flavors: %s", e)
             return []
+        else:
+            if upcoming_flavors:
+                self._cache_upcoming(location_id, today, upcoming_flavors)
+            return upcoming_flavors
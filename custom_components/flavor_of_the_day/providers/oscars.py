@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import TYPE_CHECKING
+import re
+from typing import TYPE_CHECKING, Any
 
-from bs4 import BeautifulSoup
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
 from homeassistant.util import dt as dt_util
 
 from custom_components.flavor_of_the_day.exceptions import (
@@ -13,19 +16,60 @@ from custom_components.flavor_of_the_day.exceptions import (
     LocationNotFoundError,
 )
 from custom_components.flavor_of_the_day.models import FlavorInfo, LocationInfo
-from custom_components.flavor_of_the_day.providers.base import BaseFlavorProvider
+from custom_components.flavor_of_the_day.providers.base import (
+    HTTP_OK,
+    BaseFlavorProvider,
+    LocationIndex,
+)
 
 if TYPE_CHECKING:
     from datetime import date
 
 _LOGGER = logging.getLogger(__name__)
 
+WEEKDAY_RE = re.compile(r"(?:MON|TUES|WEDNES|THURS|FRI|SATUR|SUN)DAY", re.IGNORECASE)
+# Indexed by date.weekday()
+WEEKDAYS = (
+    "MONDAY",
+    "TUESDAY",
+    "WEDNESDAY",
+    "THURSDAY",
+    "FRIDAY",
+    "SATURDAY",
+    "SUNDAY",
+)
+
+_KNOWN_LOCATIONS = LocationIndex(
+    LocationInfo(
+        store_id="oscars-west-allis",
+        name="Oscar's Frozen Custard - West Allis",
+        address="2362 S. 108th St.",
+        city="Milwaukee",
+        state="WI",
+        zip_code="53227",
+    ),
+    LocationInfo(
+        store_id="oscars-franklin",
+        name="Oscar's Frozen Custard - Franklin",
+        address="7041 South 27th St.",
+        city="Franklin",
+        state="WI",
+        zip_code="53132",
+    ),
+)
+
 
 class OscarsProvider(BaseFlavorProvider):
     """Oscar's provider implementation."""
 
     BASE_URL = "https://www.oscarscustard.com"
 
+    def __init__(self, session: aiohttp.ClientSession, config: dict[str, Any]) -> None:
+        """Initialize the Oscar's provider."""
+        super().__init__(session, config)
+        # Digest of the last homepage body parsed and the (weekday, flavor) in it
+        self._last_parse: tuple[bytes, tuple[str, str]] | None = None
+
     @property
     def provider_name(self) -> str:
         """Display name for this provider."""
@@ -42,101 +86,79 @@ class OscarsProvider(BaseFlavorProvider):
         state: str | None = None,  # noqa: ARG002
     ) -> list[LocationInfo]:
         """Return a list of all Oscar's locations, as they are fixed."""
-        known_locations = [
-            LocationInfo(
-                store_id="oscars-west-allis",
-                name="Oscar's Frozen Custard - West Allis",
-                address="2362 S. 108th St.",
-                city="Milwaukee",
-                state="WI",
-                zip_code="53227",
-            ),
-            LocationInfo(
-                store_id="oscars-franklin",
-                name="Oscar's Frozen Custard - Franklin",
-                address="7041 South 27th St.",
-                city="Franklin",
-                state="WI",
-                zip_code="53132",
-            ),
-        ]
-
-        if not search_term:
-            return known_locations
-
-        search_lower = search_term.lower()
-        return [
-            loc
-            for loc in known_locations
-            if search_lower in loc.name.lower()
-            or search_lower in loc.city.lower()
-            or search_lower in loc.address.lower()
-        ]
+        return _KNOWN_LOCATIONS.search(search_term)
 
     async def get_location_by_id(self, location_id: str) -> LocationInfo:
         """Get specific location details by store ID."""
-        # Get all known locations and find the one with matching ID
-        all_locations = await self.search_locations("")
-
-        for location in all_locations:
-            if location.store_id == location_id:
-                return location
+        location = _KNOWN_LOCATIONS.get(location_id)
+        if location is not None:
+            return location
 
         msg = f"Location with ID {location_id} not found"
         raise LocationNotFoundError(msg)
 
+    async def _scrape_homepage_flavor(self) -> tuple[str, str]:
+        """Fetch Oscar's homepage and return the weekday and flavor posted."""
+        status, html = await self._fetch_page(self.BASE_URL)
+        if status != HTTP_OK:
+            msg = "Could not access Oscar's website"
+            raise FlavorNotAvailableError(msg)
+
+        # An unchanged page yields the same flavor, so skip parsing it again
+        digest = hashlib.blake2b(html, digest_size=16).digest()
+        if self._last_parse is not None and self._last_parse[0] == digest:
+            return self._last_parse[1]
+
+        posted = self._parse_homepage_flavor(html)
+        self._last_parse = (digest, posted)
+        return posted
+
+    @staticmethod
+    def _parse_homepage_flavor(html: bytes) -> tuple[str, str]:
+        """Extract the weekday and flavor name from Oscar's homepage HTML."""
+        soup = BeautifulSoup(html, "lxml", parse_only=SoupStrainer("h5"))
+
+        # The flavor is in an h5 tag, like "Monday, September 29: RED RASPBERRY"
+        # Walk h5 tags one at a time so the search stops at the first match
+        h5 = soup.find("h5")
+        while h5 is not None:
+            text = h5.get_text(strip=True)
+            match = WEEKDAY_RE.search(text) if ":" in text else None
+            if match:
+                # The flavor name is the part after the colon
+                return match.group().upper(), text.split(":", 1)[1].strip()
+            h5 = h5.find_next("h5")
+
+        msg = "Could not find flavor of the day on Oscar's page"
+        raise FlavorNotAvailableError(msg)
+
     async def get_current_flavor(self, location_id: str) -> FlavorInfo:
         """Get today's flavor of the day from Oscar's."""
+        now = dt_util.now()
+        cached = self._get_cached_flavor(location_id, now.date())
+        if cached is not None:
+            return cached
+
         try:
-            async with self.session.get(self.BASE_URL) as response:
-                if response.status != 200:  # noqa: PLR2004
-                    msg = f"Could not access Oscar's website for location {location_id}"
-                    raise FlavorNotAvailableError(msg)  # noqa: TRY301
-
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # The flavor is in an h5 tag, like "Monday, September 29: RED RASPBERRY"
-                flavor_text = None
-                for h5 in soup.find_all("h5"):
-                    text = h5.get_text(strip=True)
-                    if ":" in text and any(
-                        day in text.upper()
-                        for day in [
-                            "MONDAY",
-                            "TUESDAY",
-                            "WEDNESDAY",
-                            "THURSDAY",
-                            "FRIDAY",
-                            "SATURDAY",
-                            "SUNDAY",
-                        ]
-                    ):
-                        flavor_text = text
-                        break
-
-                if not flavor_text:
-                    msg = f"Could not find flavor of the day on Oscar's page for location {location_id}"  # noqa: E501
-                    raise FlavorNotAvailableError(msg)  # noqa: TRY301
-
-                # The text is like "SUNDAY, SEPTEMBER 28: CHOCOLATE COVERED CHERRY"
-                # I need to extract the flavor name after the colon.
-                parts = flavor_text.split(":")
-                if len(parts) > 1:
-                    flavor_name = parts[1].strip()
-                    return FlavorInfo(
-                        name=flavor_name,
-                        available_date=dt_util.now(),
-                    )
-
-                msg = f"Could not extract flavor from Oscar's page for location {location_id}"  # noqa: E501
-                raise FlavorNotAvailableError(msg)  # noqa: TRY301
-
-        except Exception as e:
-            _LOGGER.exception("Error getting current flavor from Oscar's")
-            msg = f"Could not retrieve flavor for location {location_id}"
+            # Every Oscar's location reads the same page, so share one scrape
+            posted_day, flavor_name = await self._single_flight(
+                self.BASE_URL, self._scrape_homepage_flavor
+            )
+        except (aiohttp.ClientError, TimeoutError) as e:
+            _LOGGER.exception("Network error getting flavor for %s", location_id)
+            msg = f"Network error accessing Oscar's website for location {location_id}"
             raise FlavorNotAvailableError(msg) from e
 
+        flavor = FlavorInfo(
+            name=flavor_name,
+            available_date=now,
+        )
+        # Just after midnight the page can still show yesterday's flavor; only
+        # keep today's posting so the next poll picks up the new one
+        if posted_day == WEEKDAYS[now.weekday()]:
+            self._cache_flavor(location_id, now.date(), flavor)
+        return flavor
+
     async def get_upcoming_flavors(
         self,
         location_id: str,  # noqa: ARG002, days:  # noqa: ARG002 int = 7
@@ -5,17 +5,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, DOMAIN
+from .coordinator import FlavorUpdateCoordinator
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import FlavorUpdateCoordinator
+    from .models import FlavorInfo
 
 
 SENSOR_DESCRIPTION = SensorEntityDescription(
@@ -37,7 +39,7 @@ async def async_setup_entry(
     async_add_entities([FlavorOfTheDaySensor(coordinator, SENSOR_DESCRIPTION)])
 
 
-class FlavorOfTheDaySensor(CoordinatorEntity, SensorEntity):
+class FlavorOfTheDaySensor(CoordinatorEntity[FlavorUpdateCoordinator], SensorEntity):
     """Sensor for today's flavor."""
 
     _attr_attribution = ATTRIBUTION
@@ -54,28 +56,43 @@ class FlavorOfTheDaySensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
+        # The provider and location are fixed for the life of the coordinator
+        self._provider_name = coordinator.provider.provider_name
+        self._location_id = coordinator.location_id
+        # Device details come from the config entry and never change
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+            name=coordinator.config_entry.data.get("name", "Flavor of the Day"),
+            manufacturer=self._provider_name,
+            model="Flavor of the Day Sensor",
+        )
+        # Attributes for the current coordinator data, dropped on each update
+        self._attrs: dict[str, Any] | None = None
+        self._update_native_value()
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
         return self.coordinator.config_entry.data.get("name", "Flavor of the Day")
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this sensor."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=self.coordinator.config_entry.data.get("name", "Flavor of the Day"),
-            manufacturer=self.coordinator.provider.provider_name,
-            model="Flavor of the Day Sensor",
-        )
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return "Unknown"
-        return self.coordinator.data.name
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state when the coordinator has new data."""
+        self._attrs = None
+        self._update_native_value()
+        super()._handle_coordinator_update()
+
+    async def async_update(self) -> None:
+        """Refetch the flavor on a manual update, bypassing the daily cache."""
+        # Ignore manual update requests if the entity is disabled
+        if not self.enabled:
+            return
+        await self.coordinator.async_request_uncached_refresh()
+
+    def _update_native_value(self) -> None:
+        """Set the state from the coordinator's current data."""
+        flavor = self.coordinator.data
+        self._attr_native_value = flavor.name if flavor else "Unknown"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -83,11 +100,16 @@ class FlavorOfTheDaySensor(CoordinatorEntity, SensorEntity):
         if not self.coordinator.data:
             return {}
 
-        flavor = self.coordinator.data
+        if self._attrs is None:
+            self._attrs = self._build_attributes(self.coordinator.data)
+        return self._attrs
+
+    def _build_attributes(self, flavor: FlavorInfo) -> dict[str, Any]:
+        """Build the state attributes for a flavor."""
         attributes: dict[str, Any] = {
             "name": flavor.name,
-            "provider": self.coordinator.provider.provider_name,
-            "location_id": self.coordinator.location_id,
+            "provider": self._provider_name,
+            "location_id": self._location_id,
         }
 
         if flavor.description:
@@ -1,52 +1,84 @@
 """Services for the Flavor of the Day integration."""
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
 
 from .const import DOMAIN
 
+if TYPE_CHECKING:
+    from .coordinator import FlavorUpdateCoordinator
+
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_REFRESH = "refresh"
 
 
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for Flavor of the Day integration."""
+@callback
+def _get_coordinator(
+    hass: HomeAssistant, registry: er.EntityRegistry, entity_id: str
+) -> FlavorUpdateCoordinator | None:
+    """Return the coordinator behind a Flavor of the Day entity."""
+    entity_entry = registry.async_get(entity_id)
 
-    async def handle_refresh(call: ServiceCall) -> None:
-        """Handle refresh service call."""
-        entity_id = call.data.get("entity_id")
+    if not entity_entry:
+        _LOGGER.error("Entity %s not found", entity_id)
+        return None
 
-        if not entity_id:
-            _LOGGER.error("No entity_id provided for refresh service")
-            return
+    if entity_entry.platform != DOMAIN:
+        _LOGGER.error("Entity %s is not a Flavor of the Day entity", entity_id)
+        return None
 
-        registry = er.async_get(hass)
-        entity_entry = registry.async_get(entity_id)
+    # Get the coordinator from runtime data
+    config_entry_id = entity_entry.config_entry_id
+    if not config_entry_id:
+        _LOGGER.error("No config entry found for entity %s", entity_id)
+        return None
 
-        if not entity_entry:
-            _LOGGER.error("Entity %s not found", entity_id)
-            return
+    entry = hass.config_entries.async_get_entry(config_entry_id)
+    if not entry:
+        _LOGGER.error("Config entry %s not found", config_entry_id)
+        return None
 
-        if entity_entry.platform != DOMAIN:
-            _LOGGER.error("Entity %s is not a Flavor of the Day entity", entity_id)
-            return
+    return entry.runtime_data.coordinator
 
-        # Get the coordinator from runtime data
-        config_entry_id = entity_entry.config_entry_id
-        if not config_entry_id:
-            _LOGGER.error("No config entry found for entity %s", entity_id)
-            return
 
-        entry = hass.config_entries.async_get_entry(config_entry_id)
-        if not entry:
-            _LOGGER.error("Config entry %s not found", config_entry_id)
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for Flavor of the Day integration."""
+    # The entity registry lives as long as hass, so look it up once
+    registry = er.async_get(hass)
+
+    async def handle_refresh(call: ServiceCall) -> None:
+        """Handle refresh service call."""
+        entity_ids = cv.ensure_list(call.data.get("entity_id"))
+
+        if not entity_ids:
+            _LOGGER.error("No entity_id provided for refresh service")
             return
 
-        coordinator = entry.runtime_data.coordinator
-        await coordinator.async_request_refresh()
-        _LOGGER.info("Refreshed flavor data for %s", entity_id)
+        # Entities of the same entry share a coordinator; refresh each one once
+        coordinators: set[FlavorUpdateCoordinator] = set()
+        refreshed: list[str] = []
+        for entity_id in entity_ids:
+            coordinator = _get_coordinator(hass, registry, entity_id)
+            if coordinator is not None:
+                coordinators.add(coordinator)
+                refreshed.append(entity_id)
+
+        # Let each coordinator's debouncer run the refresh in the background,
+        # so the call returns at once and repeated calls collapse into one fetch.
+        # A forced refresh must reach the site, so the daily cache is skipped.
+        for coordinator in coordinators:
+            hass.async_create_background_task(
+                coordinator.async_request_uncached_refresh(),
+                name=f"{DOMAIN}_refresh_{coordinator.name}",
+            )
+        if refreshed:
+            _LOGGER.info("Requested flavor refresh for %s", ", ".join(refreshed))
 
     hass.services.async_register(DOMAIN, SERVICE_REFRESH, handle_refresh)
@@ -49,8 +49,11 @@ def mock_aioclient() -> Generator[aioresponses]:
 
 
 @pytest.fixture(name="integration")
-async def integration_fixture(hass: HomeAssistant) -> MockConfigEntry:
-    """Set up the flavor_of_the_day integration."""
+async def integration_fixture(
+    hass: HomeAssistant,
+    mock_flavor_coordinator: Any,  # noqa: ARG001
+) -> MockConfigEntry:
+    """Set up the flavor_of_the_day integration with canned coordinator data."""
     entry = MockConfigEntry(
         domain=DOMAIN, title="Test Location", data=CONFIG_DATA, version=1
     )
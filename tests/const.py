@@ -1,6 +1,7 @@
 """Constants for tests."""
 
 from datetime import UTC, datetime
+from types import MappingProxyType
 
 from custom_components.flavor_of_the_day.const import (
     CONF_LOCATION_ID,
@@ -10,24 +11,31 @@ from custom_components.flavor_of_the_day.const import (
 )
 from custom_components.flavor_of_the_day.models import FlavorInfo
 
-CONFIG_DATA = {
-    CONF_NAME: "Test Location",
-    CONF_PROVIDER: "culvers",
-    CONF_LOCATION_ID: "12345",
-    CONF_UPDATE_INTERVAL: 3600,
-}
+# Shared across tests, so read-only to keep one test from leaking into another
+CONFIG_DATA = MappingProxyType(
+    {
+        CONF_NAME: "Test Location",
+        CONF_PROVIDER: "culvers",
+        CONF_LOCATION_ID: "12345",
+        CONF_UPDATE_INTERVAL: 3600,
+    }
+)
 
-CONFIG_DATA_KOPPS = {
-    CONF_NAME: "Kopp's Location",
-    CONF_PROVIDER: "kopps",
-    CONF_LOCATION_ID: "brookfield",
-    CONF_UPDATE_INTERVAL: 3600,
-}
+CONFIG_DATA_KOPPS = MappingProxyType(
+    {
+        CONF_NAME: "Kopp's Location",
+        CONF_PROVIDER: "kopps",
+        CONF_LOCATION_ID: "brookfield",
+        CONF_UPDATE_INTERVAL: 3600,
+    }
+)
 
-CULVERS_LOCATION_SEARCH = {
-    "12345": "Culver's of Test City @ 123 Main St",
-    "67890": "Culver's of Other City @ 456 Oak Ave",
-}
+CULVERS_LOCATION_SEARCH = MappingProxyType(
+    {
+        "12345": "Culver's of Test City @ 123 Main St",
+        "67890": "Culver's of Other City @ 456 Oak Ave",
+    }
+)
 
 COORDINATOR_DATA = FlavorInfo(
     name="Chocolate Peanut Butter",
@@ -1,5 +1,6 @@
 """Test the Flavor of the Day config flow."""
 
+from collections.abc import Generator
 from unittest.mock import patch
 
 import pytest
@@ -10,13 +11,36 @@ from homeassistant.data_entry_flow import FlowResultType
 from custom_components.flavor_of_the_day.const import DOMAIN
 
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def mock_clientsession() -> Generator[None]:
+    """Keep every config flow test off the shared aiohttp session."""
+    with patch(
+        "custom_components.flavor_of_the_day.config_flow.async_get_clientsession"
+    ):
+        yield
+
+
+async def _search_culvers(
+    hass: HomeAssistant, search_term: str, state: str
+) -> config_entries.ConfigFlowResult:
+    """Start a user flow, pick Culver's and submit a location search."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    # Submit provider selection
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"provider": "culvers"}
+    )
+
+    # Submit location search
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"search_term": search_term, "state": state}
+    )
+
+
 async def test_form(hass: HomeAssistant) -> None:
     """Test we can instantiate the config flow."""
-    # Get the actual hass instance from the fixture
-    if hasattr(hass, "__anext__"):
-        hass = await hass.__anext__()
-
     # Import and test the config flow directly
     from custom_components.flavor_of_the_day.config_flow import FlavorOfTheDayConfigFlow
 
@@ -31,37 +55,18 @@ async def test_form(hass: HomeAssistant) -> None:
     assert hasattr(flow, "async_step_location_select")
 
 
-@pytest.mark.asyncio
 async def test_create_entry(hass: HomeAssistant) -> None:
     """Test creating an entry with valid data."""
-    with (
-        patch(
-            "custom_components.flavor_of_the_day.providers.culvers.CulversProvider.search_locations",
-            return_value=[],
-        ),
-        patch(
-            "custom_components.flavor_of_the_day.config_flow.async_get_clientsession"
-        ),
+    with patch(
+        "custom_components.flavor_of_the_day.providers.culvers.CulversProvider.search_locations",
+        return_value=[],
     ):
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": config_entries.SOURCE_USER}
-        )
-
-        # Submit provider selection
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"], {"provider": "culvers"}
-        )
-
-        # Submit location search
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"], {"search_term": "Madison", "state": "WI"}
-        )
+        result = await _search_culvers(hass, "Madison", "WI")
 
         # Since search returns empty, should get error
         assert result["errors"]["search_term"] == "no_locations_found"
 
 
-@pytest.mark.asyncio
 async def test_form_with_locations(hass: HomeAssistant) -> None:
     """Test form with locations found."""
     from custom_components.flavor_of_the_day.models import LocationInfo
@@ -94,22 +99,11 @@ async def test_form_with_locations(hass: HomeAssistant) -> None:
             return_value=True,
         ),
         patch(
-            "custom_components.flavor_of_the_day.config_flow.async_get_clientsession"
-        ),
+            "custom_components.flavor_of_the_day.async_setup_entry",
+            return_value=True,
+        ) as mock_setup_entry,
     ):
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": config_entries.SOURCE_USER}
-        )
-
-        # Submit provider selection
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"], {"provider": "culvers"}
-        )
-
-        # Submit location search
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"], {"search_term": "Madison", "state": "WI"}
-        )
+        result = await _search_culvers(hass, "Madison", "WI")
 
         # Should now show location selection form
         assert result["type"] == FlowResultType.FORM
@@ -126,3 +120,7 @@ async def test_form_with_locations(hass: HomeAssistant) -> None:
         assert result["data"]["provider"] == "culvers"
         assert result["data"]["location_id"] == "test123"
         assert result["data"]["update_interval"] == 30
+
+        # The new entry is handed to setup, which is stubbed out here
+        await hass.async_block_till_done()
+        assert len(mock_setup_entry.mock_calls) == 1
@@ -0,0 +1,250 @@
+"""Test the shared fetching and caching behaviour of the scraping providers."""
+
+import asyncio
+
+import pytest
+from aioresponses import aioresponses
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from yarl import URL
+
+from custom_components.flavor_of_the_day.providers import base
+from custom_components.flavor_of_the_day.providers.goodberrys import (
+    GoodberrysProvider,
+)
+from custom_components.flavor_of_the_day.providers.kopps import KoppsProvider
+from custom_components.flavor_of_the_day.providers.oscars import OscarsProvider
+
+PAGE_URL = "https://example.com/menu"
+KOPPS_PREVIEW_URL = f"{KoppsProvider.BASE_URL}/flavor-preview"
+KOPPS_TUESDAY_HTML = (
+    '<div id="13"><h3 class="h5 fw-black text-uppercase mb-0">Butter Pecan</h3></div>'
+)
+
+# Noon Pacific on Tuesday, October 13 and Wednesday, October 14
+TUESDAY_NOON = "2026-10-13 19:00:00+00:00"
+WEDNESDAY_NOON = "2026-10-14 19:00:00+00:00"
+
+
+async def test_fetch_page_reuses_body_on_not_modified(
+    hass: HomeAssistant, mock_aioclient: aioresponses
+) -> None:
+    """Test a 304 answer is served from the body stored with its ETag."""
+    mock_aioclient.get(
+        PAGE_URL, status=200, body="<p>menu</p>", headers={"ETag": '"v1"'}
+    )
+    mock_aioclient.get(PAGE_URL, status=304)
+    provider = OscarsProvider(async_get_clientsession(hass), {})
+
+    assert await provider._fetch_page(PAGE_URL) == (200, b"<p>menu</p>")
+    assert await provider._fetch_page(PAGE_URL) == (200, b"<p>menu</p>")
+
+    requests = mock_aioclient.requests[("GET", URL(PAGE_URL))]
+    assert requests[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+async def test_fetch_page_does_not_store_truncated_body(
+    hass: HomeAssistant,
+    mock_aioclient: aioresponses,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a body cut off at the size cap is never revalidated or reused."""
+    monkeypatch.setattr(base, "MAX_PAGE_BYTES", 4)
+    monkeypatch.setattr(base, "READ_CHUNK_SIZE", 4)
+    mock_aioclient.get(
+        PAGE_URL, status=200, body="<p>menu</p>", headers={"ETag": '"v1"'}
+    )
+    mock_aioclient.get(
+        PAGE_URL, status=200, body="<p>menu</p>", headers={"ETag": '"v1"'}
+    )
+    provider = OscarsProvider(async_get_clientsession(hass), {})
+
+    status, body = await provider._fetch_page(PAGE_URL)
+    assert status == 200
+    assert len(body) < len(b"<p>menu</p>")
+
+    await provider._fetch_page(PAGE_URL)
+    requests = mock_aioclient.requests[("GET", URL(PAGE_URL))]
+    assert "If-None-Match" not in requests[1].kwargs["headers"]
+
+
+async def test_single_flight_shares_one_fetch(hass: HomeAssistant) -> None:
+    """Test concurrent callers with the same key wait on a single fetch."""
+    provider = OscarsProvider(async_get_clientsession(hass), {})
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "Butter Pecan"
+
+    tasks = [
+        asyncio.create_task(provider._single_flight("shared", fetch)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["Butter Pecan"] * 3
+    assert calls == 1
+
+
+async def test_single_flight_survives_cancelled_follower(hass: HomeAssistant) -> None:
+    """Test cancelling a waiting caller leaves the shared fetch intact."""
+    provider = OscarsProvider(async_get_clientsession(hass), {})
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "Butter Pecan"
+
+    leader = asyncio.create_task(provider._single_flight("follower", fetch))
+    follower = asyncio.create_task(provider._single_flight("follower", fetch))
+    await asyncio.sleep(0)
+
+    follower.cancel()
+    release.set()
+
+    assert await leader == "Butter Pecan"
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+
+async def test_single_flight_follower_refetches_after_leader_cancelled(
+    hass: HomeAssistant,
+) -> None:
+    """Test a waiting caller fetches itself when the first caller is cancelled."""
+    provider = OscarsProvider(async_get_clientsession(hass), {})
+
+    async def stuck() -> str:
+        await asyncio.Event().wait()
+        return "never"
+
+    async def fetch() -> str:
+        return "Mint"
+
+    leader = asyncio.create_task(provider._single_flight("leader", stuck))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(provider._single_flight("leader", fetch))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+
+    assert await follower == "Mint"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_kopps_retries_server_errors(
+    hass: HomeAssistant,
+    mock_aioclient: aioresponses,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test Kopp's backs off after a 5xx and uses the next good response."""
+    freezer.move_to(TUESDAY_NOON)
+    mock_aioclient.get(KOPPS_PREVIEW_URL, status=503)
+    mock_aioclient.get(
+        KOPPS_PREVIEW_URL,
+        status=200,
+        body=KOPPS_TUESDAY_HTML,
+    )
+    provider = KoppsProvider(async_get_clientsession(hass), {"retry_delay": 0})
+
+    flavor = await provider.get_current_flavor("kopps-brookfield")
+
+    assert flavor.name == "Butter Pecan"
+    assert len(mock_aioclient.requests[("GET", URL(KOPPS_PREVIEW_URL))]) == 2
+
+
+async def test_oscars_cache_expires_with_the_date(
+    hass: HomeAssistant,
+    mock_aioclient: aioresponses,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test today's flavor is reused until the local date changes."""
+    mock_aioclient.get(
+        OscarsProvider.BASE_URL, body="<h5>Tuesday, October 13: Butter Pecan</h5>"
+    )
+    mock_aioclient.get(
+        OscarsProvider.BASE_URL, body="<h5>Wednesday, October 14: Mint</h5>"
+    )
+    provider = OscarsProvider(async_get_clientsession(hass), {})
+
+    freezer.move_to(TUESDAY_NOON)
+    assert (await provider.get_current_flavor("oscars-franklin")).name == "Butter Pecan"
+    assert (await provider.get_current_flavor("oscars-franklin")).name == "Butter Pecan"
+
+    freezer.move_to(WEDNESDAY_NOON)
+    assert (await provider.get_current_flavor("oscars-franklin")).name == "Mint"
+
+
+async def test_oscars_does_not_cache_yesterdays_posting(
+    hass: HomeAssistant,
+    mock_aioclient: aioresponses,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a flavor posted for another day is fetched again on the next poll."""
+    freezer.move_to(TUESDAY_NOON)
+    mock_aioclient.get(OscarsProvider.BASE_URL, body="<h5>Monday, October 12: Old</h5>")
+    mock_aioclient.get(
+        OscarsProvider.BASE_URL, body="<h5>Tuesday, October 13: New</h5>"
+    )
+    provider = OscarsProvider(async_get_clientsession(hass), {})
+
+    assert (await provider.get_current_flavor("oscars-franklin")).name == "Old"
+    assert (await provider.get_current_flavor("oscars-franklin")).name == "New"
+
+
+async def test_clear_cache_forces_refetch(
+    hass: HomeAssistant,
+    mock_aioclient: aioresponses,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test clearing a location's cache makes the next lookup hit the site."""
+    freezer.move_to(TUESDAY_NOON)
+    mock_aioclient.get(
+        OscarsProvider.BASE_URL, body="<h5>Tuesday, October 13: Butter Pecan</h5>"
+    )
+    mock_aioclient.get(
+        OscarsProvider.BASE_URL, body="<h5>Tuesday, October 13: Mint</h5>"
+    )
+    provider = OscarsProvider(async_get_clientsession(hass), {})
+
+    assert (await provider.get_current_flavor("oscars-franklin")).name == "Butter Pecan"
+    provider.clear_cache("oscars-franklin")
+    assert (await provider.get_current_flavor("oscars-franklin")).name == "Mint"
+
+
+async def test_goodberrys_reads_the_page_every_poll(
+    hass: HomeAssistant, mock_aioclient: aioresponses
+) -> None:
+    """Test Goodberry's, whose page has no date, is never served from cache."""
+    mock_aioclient.get(
+        GoodberrysProvider.BASE_URL,
+        body='<div class="flavor-of-the-day"><h2>Oreo</h2></div>',
+    )
+    mock_aioclient.get(
+        GoodberrysProvider.BASE_URL,
+        body='<div class="flavor-of-the-day"><h2>Butterfinger</h2></div>',
+    )
+    provider = GoodberrysProvider(async_get_clientsession(hass), {})
+
+    location_id = "goodberrys-southern-pines"
+    assert (await provider.get_current_flavor(location_id)).name == "Oreo"
+    assert (await provider.get_current_flavor(location_id)).name == "Butterfinger"
+
+
+def test_kopps_request_semaphore_per_loop() -> None:
+    """Test the Kopp's request limit works on every event loop it is used from."""
+
+    async def contend() -> None:
+        async def hold() -> None:
+            async with KoppsProvider._get_request_semaphore():
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(hold() for _ in range(6)))
+
+    asyncio.run(contend())
+    asyncio.run(contend())
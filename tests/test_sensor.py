@@ -8,6 +8,7 @@ from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.flavor_of_the_day.const import DOMAIN
+from custom_components.flavor_of_the_day.models import FlavorInfo
 
 from .const import CONFIG_DATA
 
@@ -66,3 +67,24 @@ async def test_sensor_unavailable(hass: HomeAssistant) -> None:
         state = hass.states.get("sensor.test_location_test_location")
         assert state
         assert state.state == "Unknown"
+
+
+async def test_sensor_coordinator_update(
+    hass: HomeAssistant, integration: MockConfigEntry
+) -> None:
+    """Test the sensor state and attributes follow new coordinator data."""
+    state = hass.states.get("sensor.test_location_test_location")
+    assert state
+    assert state.state == "Chocolate Peanut Butter"
+
+    integration.runtime_data.coordinator.async_set_updated_data(
+        FlavorInfo(name="Mint", description="Cool mint custard")
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test_location_test_location")
+    assert state
+    assert state.state == "Mint"
+    assert state.attributes["name"] == "Mint"
+    assert state.attributes["description"] == "Cool mint custard"
+    assert "allergens" not in state.attributes
@@ -0,0 +1,91 @@
+"""Test flavor_of_the_day services."""
+
+from unittest.mock import Mock, call, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.flavor_of_the_day.const import DOMAIN
+from custom_components.flavor_of_the_day.services import SERVICE_REFRESH
+
+ENTITY_ID = "sensor.test_location_test_location"
+UNCACHED_REFRESH = (
+    "custom_components.flavor_of_the_day.FlavorUpdateCoordinator"
+    ".async_request_uncached_refresh"
+)
+
+
+async def _call_refresh(hass: HomeAssistant, data: dict) -> int:
+    """Call the refresh service and return how many refreshes it started."""
+    with patch(UNCACHED_REFRESH) as mock_refresh:
+        await hass.services.async_call(DOMAIN, SERVICE_REFRESH, data, blocking=True)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    return mock_refresh.call_count
+
+
+async def test_refresh_single_entity(
+    hass: HomeAssistant,
+    integration: MockConfigEntry,  # noqa: ARG001
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test refreshing an entity given as a plain string."""
+    assert await _call_refresh(hass, {"entity_id": ENTITY_ID}) == 1
+    assert f"Requested flavor refresh for {ENTITY_ID}" in caplog.text
+
+
+async def test_refresh_entities_of_one_entry_once(
+    hass: HomeAssistant, integration: MockConfigEntry
+) -> None:
+    """Test entities sharing a config entry refresh its coordinator once."""
+    other = er.async_get(hass).async_get_or_create(
+        "sensor", DOMAIN, "other", config_entry=integration
+    )
+
+    assert await _call_refresh(hass, {"entity_id": [ENTITY_ID, other.entity_id]}) == 1
+
+
+async def test_refresh_skips_unknown_entity(
+    hass: HomeAssistant,
+    integration: MockConfigEntry,  # noqa: ARG001
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an unknown entity is reported and left out of the refresh."""
+    assert await _call_refresh(hass, {"entity_id": [ENTITY_ID, "sensor.nope"]}) == 1
+    assert "Entity sensor.nope not found" in caplog.text
+    assert f"Requested flavor refresh for {ENTITY_ID}\n" in caplog.text
+
+
+async def test_refresh_without_entity_id(
+    hass: HomeAssistant,
+    integration: MockConfigEntry,  # noqa: ARG001
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the service does nothing when no entity is given."""
+    assert await _call_refresh(hass, {}) == 0
+    assert "No entity_id provided for refresh service" in caplog.text
+
+
+async def test_refresh_clears_cache_then_refreshes(
+    hass: HomeAssistant, integration: MockConfigEntry
+) -> None:
+    """Test the background refresh clears the daily cache and still runs."""
+    provider = integration.runtime_data.provider
+    with (
+        patch.object(provider, "clear_cache") as mock_clear,
+        patch(
+            "custom_components.flavor_of_the_day.FlavorUpdateCoordinator"
+            ".async_request_refresh"
+        ) as mock_refresh,
+    ):
+        calls = Mock()
+        calls.attach_mock(mock_clear, "clear_cache")
+        calls.attach_mock(mock_refresh, "refresh")
+        await hass.services.async_call(
+            DOMAIN, SERVICE_REFRESH, {"entity_id": ENTITY_ID}, blocking=True
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    location_id = integration.runtime_data.coordinator.location_id
+    assert calls.mock_calls == [call.clear_cache(location_id), call.refresh()]